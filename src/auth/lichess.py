@@ -4,6 +4,7 @@ import time
 
 import pyotp
 from loguru import logger
+from selenium.common.exceptions import NoSuchElementException, WebDriverException
 from selenium.webdriver.common.by import By
 
 from ..config import ConfigManager
@@ -17,11 +18,11 @@ class LichessAuth:
         self.config_manager = config_manager
         self.browser_manager = browser_manager
 
-    def sign_in(self) -> bool:
-        """Sign in to Lichess"""
+    def sign_in(self, cookies_loaded: bool = False) -> bool:
+        """Sign in to Lichess, cookies_loaded if they were applied before navigating"""
         try:
             # First try loading saved cookies
-            if self._try_cookie_login():
+            if self._try_cookie_login(cookies_loaded):
                 return True
 
             # Fall back to username/password login
@@ -34,19 +35,19 @@ class LichessAuth:
             logger.error(f"Failed during sign-in process: {e}")
             return False
 
-    def _try_cookie_login(self) -> bool:
+    def _try_cookie_login(self, cookies_loaded: bool = False) -> bool:
         """Try to login using saved cookies"""
         logger.debug("Attempting cookie-based login")
 
-        # Load cookies and check if we're logged in
-        cookies_loaded = self.browser_manager.load_cookies()
         if not cookies_loaded:
-            return False
+            # Load cookies and check if we're logged in
+            if not self.browser_manager.load_cookies():
+                return False
 
-        # Refresh the page to apply cookies
-        driver = self.browser_manager.get_driver()
-        driver.refresh()
-        time.sleep(2)
+            # Refresh the page to apply cookies
+            driver = self.browser_manager.get_driver()
+            driver.refresh()
+            time.sleep(2)
 
         if self.browser_manager.is_logged_in():
             logger.success("Successfully logged in using saved cookies")
@@ -135,7 +136,7 @@ class LichessAuth:
                 try:
                     totp_field = driver.find_element(By.CSS_SELECTOR, selector)
                     break
-                except:
+                except NoSuchElementException:
                     continue
 
             if not totp_field:
@@ -160,7 +161,7 @@ class LichessAuth:
                 )
                 submit_button.click()
                 logger.debug("Submitted TOTP form")
-            except:
+            except WebDriverException:
                 # Try alternative submit methods
                 totp_field.submit()
                 logger.debug("Submitted TOTP form via input")
@@ -1,8 +1,14 @@
 """Core chess bot functionality"""
 
 from .board import BoardHandler
-from .browser import BrowserManager
+from .browser import BrowserManager, get_browser
 from .engine import ChessEngine
 from .game import GameManager
 
-__all__ = ["BrowserManager", "ChessEngine", "GameManager", "BoardHandler"]
+__all__ = [
+    "BrowserManager",
+    "ChessEngine",
+    "GameManager",
+    "BoardHandler",
+    "get_browser",
+]
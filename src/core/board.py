@@ -1,12 +1,11 @@
 """Board Handler - Chess board interaction and move detection"""
 
-import re
-from math import ceil
 from time import sleep
 from typing import List, Optional
 
 import chess
 from loguru import logger
+from selenium.common.exceptions import StaleElementReferenceException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support import expected_conditions as ec
@@ -14,13 +13,164 @@ from selenium.webdriver.support.wait import WebDriverWait
 
 from ..core.browser import BrowserManager
 from ..utils.debug import DebugUtils
-from ..utils.helpers import advanced_humanized_delay, humanized_delay
+from ..utils.helpers import humanized_total
 from ..utils.resilience import element_retry, move_retry, safe_execute
 
+# Arrow (x, y) offsets of each square from the board centre, White's point of view
+_SQUARE_OFFSETS = tuple(
+    (chess.square_file(square) - 3.5, 3.5 - chess.square_rank(square))
+    for square in chess.SQUARES
+)
+
+# Every move in the move list, tag or class based depending on the page version
+_MOVES_CSS = "kwdb, .kwdb"
+
+# Resolves with the text of move arguments[1] (0-based) once the page shows it,
+# or null when the game ends or arguments[2] ms pass without it
+_WAIT_FOR_MOVE_JS = """
+    var movesCss = arguments[0];
+    var index = arguments[1];
+    var timeoutMs = arguments[2];
+    var done = arguments[arguments.length - 1];
+
+    var read = function () {
+        var e = document.querySelectorAll(movesCss)[index];
+        var text = e ? e.textContent.trim() : "";
+        return text && text !== "..." ? text : null;
+    };
+
+    var text = read();
+    if (text || document.querySelector(".follow-up")) {
+        done(text);
+        return;
+    }
+
+    var timer = null;
+    var observer = new MutationObserver(function () {
+        var text = read();
+        if (text || document.querySelector(".follow-up")) {
+            observer.disconnect();
+            clearTimeout(timer);
+            done(text);
+        }
+    });
+    observer.observe(document.body, {
+        childList: true, subtree: true, characterData: true
+    });
+    timer = setTimeout(function () {
+        observer.disconnect();
+        done(null);
+    }, timeoutMs);
+"""
+
+# Empties the board's SVG shapes layer; also prepended to the move wait
+_CLEAR_ARROW_JS = """
+    var g = document.getElementsByTagName("g")[0];
+    if (g) {
+        g.textContent = "";
+    }
+"""
+
+# Defines window.__drawArrow, which (re)creates the arrowhead marker if the
+# board's SVG lost it, clears existing arrows, measures the board (first arrow
+# only) and draws; sent once per game instead of with every arrow
+_ARROW_INSTALL_JS = """
+    window.__drawArrow = function (x1, y1, x2, y2, src, dst, size) {
+        var defs = document.getElementsByTagName("defs")[0];
+        if (defs && document.getElementsByTagName("marker")[0] == null) {
+            var marker = document.createElementNS("http://www.w3.org/2000/svg", "marker");
+            marker.setAttribute("id", "arrowhead-g");
+            marker.setAttribute("orient", "auto");
+            marker.setAttribute("markerWidth", "4");
+            marker.setAttribute("markerHeight", "8");
+            marker.setAttribute("refX", "2.05");
+            marker.setAttribute("refY", "2.01");
+            marker.setAttribute("cgKey", "g");
+
+            var path = document.createElement('path')
+            path.setAttribute("d", "M0,0 V4 L3,2 Z");
+            path.setAttribute("fill", "#15781B");
+            marker.appendChild(path);
+            defs.appendChild(marker);
+        }
+
+        // Look the layer up on every call, chessground may have replaced it;
+        // false tells the caller to reinstall and try again
+        var g = document.getElementsByTagName("g")[0];
+        if (!g || !g.isConnected) {
+            return false;
+        }
+        g.textContent = "";
+
+        if (!size) {
+            var cg = document.querySelector("main.round cg-container");
+            size = cg ? parseInt(cg.style.width, 10) : 0;
+            if (!size) {
+                return false;
+            }
+        }
+
+        // Create the main arrow line
+        var child_g = document.createElementNS('http://www.w3.org/2000/svg', 'line');
+        child_g.setAttribute("stroke","#15781B");
+        child_g.setAttribute("stroke-width","0.15625");
+        child_g.setAttribute("stroke-linecap","round");
+        child_g.setAttribute("marker-end","url(#arrowhead-g)");
+        child_g.setAttribute("opacity","1");
+        child_g.setAttribute("x1", x1);
+        child_g.setAttribute("y1", y1);
+        child_g.setAttribute("x2", x2);
+        child_g.setAttribute("y2", y2);
+        child_g.setAttribute("cgHash", `${size}, ${size},` + src + `,` + dst + `,green`);
+        g.appendChild(child_g);
+
+        // Add subtle destination indicator (small dot)
+        var destIndicator = document.createElementNS('http://www.w3.org/2000/svg', 'circle');
+        destIndicator.setAttribute("cx", x2);
+        destIndicator.setAttribute("cy", y2);
+        destIndicator.setAttribute("r", "0.08");
+        destIndicator.setAttribute("fill", "#FFD700");
+        destIndicator.setAttribute("fill-opacity", "0.9");
+        destIndicator.setAttribute("stroke", "#15781B");
+        destIndicator.setAttribute("stroke-width", "0.02");
+        destIndicator.setAttribute("cgHash", `${size}, ${size},` + src + `,` + dst + `,destination`);
+        g.appendChild(destIndicator);
+
+        // Add very subtle pulsing to destination
+        var pulseAnim = document.createElementNS('http://www.w3.org/2000/svg', 'animate');
+        pulseAnim.setAttribute("attributeName", "r");
+        pulseAnim.setAttribute("values", "0.08;0.12;0.08");
+        pulseAnim.setAttribute("dur", "2s");
+        pulseAnim.setAttribute("repeatCount", "indefinite");
+        destIndicator.appendChild(pulseAnim);
+
+        return size;
+    };
+"""
+
+# Draws through the installed function, or returns false if the page lost it
+_ARROW_CALL_JS = """
+    if (!window.__drawArrow) {
+        return false;
+    }
+    return window.__drawArrow.apply(null, arguments);
+"""
+
+
+def _move_num(n: int) -> int:
+    """Full-move number for a 1-based ply index"""
+    return (n + 1) >> 1
+
 
 class BoardHandler:
     """Handles chess board interactions and move detection"""
 
+    # Selectors for the move input box, most reliable first
+    _MOVE_INPUT_SELECTORS = (
+        (By.CSS_SELECTOR, "input.ready"),  # Most common game input selector
+        (By.CSS_SELECTOR, "main.round input"),  # Input within game container
+    )
+
     def __init__(
         self,
         browser_manager: BrowserManager,
@@ -29,24 +179,48 @@ class BoardHandler:
     ):
         self.browser_manager = browser_manager
         self.debug_utils = debug_utils
-        self.driver = browser_manager.get_driver()
         self.config_manager = config_manager
 
+        # Per-game caches: board size (px) read from cg-container and our color
+        self._board_size: Optional[int] = None
+        self._color: Optional[str] = None
+
+        # Move input selector that last matched, tried first on later lookups
+        self._working_selector: Optional[tuple] = None
+        self._move_input = None
+
+        # Whether suggestion arrows are drawn, refreshed by GameManager per game
+        self.arrows_enabled = config_manager is None or config_manager.show_arrow
+        # Whether render_arrow has drawn something not yet cleared
+        self._arrow_drawn = False
+
+    @property
+    def driver(self):
+        """WebDriver of the shared browser, launched on first access"""
+        return self.browser_manager.ensure_driver()
+
     def wait_for_game_ready(self) -> bool:
         """Wait for game to be ready and return True if successful"""
         logger.debug("Waiting for game setup")
 
-        # Wait for follow-up to disappear
-        while self.browser_manager.check_exists_by_class("follow-up"):
-            logger.debug("Found follow-up element, waiting for user action...")
-            sleep(1)
-
-        logger.debug("No follow-up found, waiting for game interface")
+        # New game page, board size, color and SVG defs may have changed
+        self._board_size = None
+        self._color = None
+        self._move_input = None
+        self._arrow_drawn = False
 
         try:
+            # Wait for follow-up to disappear (user has to start a new game)
+            logger.debug("Waiting for follow-up element to disappear...")
+            WebDriverWait(self.driver, 600, poll_frequency=0.1).until(
+                ec.invisibility_of_element_located((By.CLASS_NAME, "follow-up"))
+            )
+            logger.debug("No follow-up found, waiting for game interface")
+
             # First, wait to be in an actual game URL (not lobby)
-            max_url_wait = 60  # Wait up to 60 seconds for game to start
+            max_url_wait = 240  # Wait up to 60 seconds (0.25s polls) for game to start
             url_wait_count = 0
+            logger.debug("Waiting to leave the lobby for a game page")
             while url_wait_count < max_url_wait:
                 current_url = self.driver.current_url
                 # Check if we're in an actual game (not lobby, not tournament, etc.)
@@ -58,10 +232,9 @@ class BoardHandler:
                     and "/training" not in current_url
                     and len(current_url.split("/")[-1]) >= 8
                 ):  # Game IDs are typically 8+ chars
-                    logger.debug(f"Detected game URL: {current_url}")
+                    logger.debug("Detected game URL: {}", current_url)
                     break
-                logger.debug(f"Still on lobby/non-game page: {current_url}, waiting...")
-                sleep(1)
+                sleep(0.25)
                 url_wait_count += 1
 
             if url_wait_count >= max_url_wait:
@@ -76,35 +249,15 @@ class BoardHandler:
             )
             logger.debug("Game board found")
 
-            # Try multiple selectors for move input box - but be more specific
-            move_input_selectors = [
-                (By.CLASS_NAME, "ready"),  # Most common game input selector
-                (By.CSS_SELECTOR, "main.round input"),  # Input within game container
-                (By.CSS_SELECTOR, "input.ready"),  # Ready input specifically
-                (
-                    By.XPATH,
-                    "//main[contains(@class,'round')]//input",
-                ),  # Input in round/game main
-            ]
-
-            move_input_found = False
-            for selector_type, selector_value in move_input_selectors:
-                try:
-                    WebDriverWait(self.driver, 10).until(
-                        ec.presence_of_element_located((selector_type, selector_value))
-                    )
-                    logger.debug(
-                        f"Move input found using {selector_type}: {selector_value}"
-                    )
-                    move_input_found = True
-                    break
-                except:
-                    continue
-
-            if not move_input_found:
+            self._move_input = self._find_move_input()
+            if not self._move_input:
                 logger.error("Could not find move input element in game interface")
                 return False
 
+            self.install_move_observer()
+            if self.arrows_enabled:
+                self.install_arrow_script()
+
             logger.debug("Game interface ready")
             return True
 
@@ -114,151 +267,202 @@ class BoardHandler:
 
     def determine_player_color(self) -> str:
         """Determine if we're playing as White or Black"""
-        board_set_for_white = self.browser_manager.check_exists_by_class(
-            "orientation-white"
-        )
+        # Color is fixed for the whole game, only ask the page once
+        if self._color is not None:
+            return self._color
+
+        board_set_for_white = self.browser_manager.exists_class("orientation-white")
 
         if board_set_for_white:
             logger.info("Playing as WHITE")
-            return "W"
+            self._color = "W"
         else:
             logger.info("Playing as BLACK")
-            return "B"
-
-    @element_retry(max_retries=3, delay=1.0)
-    def get_move_input_handle(self):
-        """Get the move input element"""
-        # Try multiple selectors for better reliability - same as wait_for_game_ready
-        move_input_selectors = [
-            (By.CLASS_NAME, "ready"),  # Most common game input selector
-            (By.CSS_SELECTOR, "main.round input"),  # Input within game container
-            (By.CSS_SELECTOR, "input.ready"),  # Ready input specifically
-            (
-                By.XPATH,
-                "//main[contains(@class,'round')]//input",
-            ),  # Input in round/game main
-        ]
-
-        for selector_type, selector_value in move_input_selectors:
+            self._color = "B"
+        return self._color
+
+    def _find_move_input(self):
+        """Locate the move input box, trying the last working selector first"""
+        move_input_selectors = list(self._MOVE_INPUT_SELECTORS)
+        if self._working_selector:
+            move_input_selectors.remove(self._working_selector)
+            move_input_selectors.insert(0, self._working_selector)
+
+        # Short per-selector wait - lichess renders the input almost instantly
+        for selector in move_input_selectors:
             try:
-                WebDriverWait(self.driver, 10).until(
-                    ec.presence_of_element_located((selector_type, selector_value))
-                )
-                element = self.driver.find_element(selector_type, selector_value)
-                logger.debug(
-                    f"Move input handle found using {selector_type}: {selector_value}"
+                element = WebDriverWait(self.driver, 2).until(
+                    ec.presence_of_element_located(selector)
                 )
+                logger.debug("Move input found using {}: {}", *selector)
+                self._working_selector = selector
                 return element
             except Exception:
                 continue
 
-        logger.error("Could not find move input handle with any selector")
-        return None
-
-    @move_retry(max_retries=3, delay=0.5)
-    def find_move_by_alternatives(self, move_number: int):
-        """Try alternative selectors to find moves"""
-        # Try finding all moves and get by index (most reliable)
+        # Extended wait on the preferred selector for slow connections
         try:
-            elements = self.driver.find_elements(By.CLASS_NAME, "kwdb")
-            if len(elements) >= move_number:
-                element = elements[move_number - 1]  # 0-based indexing
-                move_text = element.text.strip()
-                if move_text:  # Only return if there's actual text
-                    logger.debug(
-                        f"Found move {move_number}: '{move_text}' by class index"
-                    )
-                    return element
-        except:
-            pass
-
-        # Alternative selectors to try (only if class method fails)
-        selectors = [
-            f"//kwdb[{move_number}]",  # Shortest XPath
-            f"//rm6/l4x/kwdb[{move_number}]",  # Medium XPath
-            f"/html/body/div[2]/main/div[1]/rm6/l4x/kwdb[{move_number}]",  # Original
-        ]
-
-        for selector in selectors:
-            try:
-                element = self.driver.find_element(By.XPATH, selector)
-                move_text = element.text.strip()
-                if move_text:  # Only return if there's actual text
-                    logger.debug(
-                        f"Found move {move_number}: '{move_text}' using {selector}"
-                    )
-                    return element
-            except:
-                continue
+            return WebDriverWait(self.driver, 10).until(
+                ec.presence_of_element_located(move_input_selectors[0])
+            )
+        except Exception:
+            return None
 
-        return None
+    @element_retry(max_retries=3, delay=1.0)
+    def get_move_input_handle(self):
+        """Get the move input element, reusing the cached one when available"""
+        if self._move_input is None:
+            self._move_input = self._find_move_input()
+            if self._move_input is None:
+                logger.error("Could not find move input handle with any selector")
+        return self._move_input
+
+    def _read_move_from_dom(self, move_number: int) -> Optional[str]:
+        """Read the move text straight from the move list, None if absent"""
+        move_text = safe_execute(
+            self.browser_manager.execute_script,
+            """
+            var n = arguments[0];
+
+            // kwdb is a custom tag; older move lists used it as a class instead
+            var e = (
+                document.getElementsByTagName("kwdb")[n - 1] ||
+                document.getElementsByClassName("kwdb")[n - 1]
+            );
+            return e && e.textContent.trim() ? e.textContent.trim() : null;
+            """,
+            move_number,
+            default_return=None,
+            log_errors=False,
+        )
+
+        if move_text:
+            logger.debug(
+                "Found move {}: '{}' by fallback lookup", move_number, move_text
+            )
+        return move_text
+
+    def _fetch_all_move_texts(self) -> List[str]:
+        """Fetch the text of every move in the move list in one round-trip"""
+        return self.browser_manager.execute_script(
+            """
+            return Array.from(
+                document.querySelectorAll(arguments[0]),
+                function (e) { return e.textContent.trim(); }
+            );
+            """,
+            _MOVES_CSS,
+        )
 
     def get_previous_moves(self, board: chess.Board) -> int:
         """Get all previous moves and update board, return current move number"""
         logger.debug("Getting previous moves from board")
-        temp_move_number = 1
 
-        # First check if there are ANY moves at all
-        first_move = self.find_move_by_alternatives(1)
-        if not first_move:
+        move_texts = self._fetch_all_move_texts()
+        if not move_texts:
             logger.debug(
                 "No moves found on board - this appears to be the start of the game"
             )
             return 1  # Start from move 1
 
-        while temp_move_number < 999:  # Safety limit
-            move_element = self.find_move_by_alternatives(temp_move_number)
+        logger.debug("Found previous moves: {}", move_texts)
 
-            if move_element:
-                move_text = move_element.text.strip()
-                if (
-                    not move_text or move_text == "..."
-                ):  # Skip empty or placeholder moves
-                    temp_move_number += 1
-                    continue
-
-                logger.debug(f"Found previous move {temp_move_number}: {move_text}")
-                try:
-                    board.push_san(move_text)
-                    temp_move_number += 1
-                except Exception as e:
-                    logger.error(f"Invalid move notation '{move_text}': {e}")
-                    self.debug_utils.save_debug_info(
-                        self.driver, temp_move_number, board
-                    )
-                    break
-            else:
-                logger.debug(
-                    f"No more previous moves found. Total moves processed: {temp_move_number - 1}"
-                )
-                # Only save debug info if we have moves but can't parse them
-                if temp_move_number == 1:
-                    logger.debug("No moves on board - starting fresh game")
-                elif (
-                    temp_move_number <= 3
-                ):  # If we can't find early moves (might be selector issue)
-                    logger.warning(
-                        "Could not find expected moves, investigating selectors"
-                    )
-                    self.debug_utils.debug_move_list_structure(self.driver)
-                    self.debug_utils.save_debug_info(
-                        self.driver, temp_move_number, board
-                    )
-                break
-
-        return temp_move_number
+        # Replay the whole history under one handler; the loop variable
+        # tells us where it stopped if a move fails to parse
+        temp_move_number = 0
+        move_text = ""
+        try:
+            for temp_move_number, move_text in enumerate(move_texts, 1):
+                if move_text and move_text != "...":  # Skip placeholder moves
+                    board.push(board.parse_san(move_text))
+        except ValueError as e:
+            logger.error(f"Invalid move notation '{move_text}': {e}")
+            self.debug_utils.save_debug_info(self.driver, temp_move_number, board)
+            return temp_move_number
+
+        logger.debug("Total previous moves processed: {}", len(move_texts))
+        return len(move_texts) + 1
+
+    def resync_from_dom(self, board: chess.Board) -> int:
+        """Rebuild the board from the full move list, return current move number"""
+        board.reset()
+        return self.get_previous_moves(board)
+
+    def install_move_observer(self) -> None:
+        """Mirror the move list into window.__moves whenever the page updates it"""
+        self.browser_manager.execute_script(
+            """
+            var movesCss = arguments[0];
+            var update = function () {
+                window.__moves = Array.from(
+                    document.querySelectorAll(movesCss),
+                    function (e) { return e.textContent.trim(); }
+                );
+            };
+
+            if (window.__moveObserver) {
+                window.__moveObserver.disconnect();
+            }
+            window.__moveObserver = new MutationObserver(update);
+            window.__moveObserver.observe(
+                document.querySelector("rm6") || document.body,
+                { childList: true, subtree: true, characterData: true }
+            );
+            update();
+            """,
+            _MOVES_CSS,
+        )
+        logger.debug("Installed move list observer")
 
     def check_for_move(self, move_number: int) -> Optional[str]:
         """Check if a move exists at the given position and return move text"""
-        move_element = self.find_move_by_alternatives(move_number)
+        move_text = self.browser_manager.execute_script(
+            "return window.__moves ? (window.__moves[arguments[0]] || '') : null;",
+            move_number - 1,
+        )
+
+        if move_text is None:
+            # Observer was lost (e.g. page reload) - reinstall and query the DOM
+            self.install_move_observer()
+            if self.arrows_enabled:
+                self.install_arrow_script()
+            move_text = self._read_move_from_dom(move_number)
 
-        if move_element:
-            move_text = move_element.text.strip()
-            if move_text and move_text != "...":  # Exclude empty and placeholder moves
-                return move_text
+        if move_text and move_text != "...":  # Exclude empty and placeholder moves
+            return move_text
 
         return None
 
+    def wait_for_next_move(
+        self, move_number: int, timeout_ms: int = 5000
+    ) -> Optional[str]:
+        """Wait in the page for the move at the given position and return its text"""
+        try:
+            return self.browser_manager.execute_async_script(
+                _WAIT_FOR_MOVE_JS, _MOVES_CSS, move_number - 1, timeout_ms
+            )
+        except Exception as e:
+            logger.debug("Async move wait failed, polling instead: {}", e)
+            return self.check_for_move(move_number)
+
+    def poll_opponent(self, move_number: int, timeout_ms: int = 5000) -> Optional[str]:
+        """Clear our arrow if one is drawn and wait for the opponent's move"""
+        if not self._arrow_drawn:
+            return self.wait_for_next_move(move_number, timeout_ms)
+
+        self._arrow_drawn = False
+        try:
+            return self.browser_manager.execute_async_script(
+                _CLEAR_ARROW_JS + _WAIT_FOR_MOVE_JS,
+                _MOVES_CSS,
+                move_number - 1,
+                timeout_ms,
+            )
+        except Exception as e:
+            logger.debug("Async move wait failed, polling instead: {}", e)
+            self.clear_arrow()
+            return self.check_for_move(move_number)
+
     def validate_and_push_move(
         self,
         board: chess.Board,
@@ -268,253 +472,111 @@ class BoardHandler:
     ) -> bool:
         """Validate and push a move to the board"""
         try:
-            # Check if move is legal in current position
-            test_move = board.parse_san(move_text)
-            if test_move in board.legal_moves:
-                uci = board.push_san(move_text)
-                move_desc = "us" if is_our_move else "opponent"
-                logger.success(f"{ceil(move_number / 2)}. {uci.uci()} [{move_desc}]")
-                return True
-            else:
-                logger.warning(f"Move '{move_text}' is not legal in current position")
-                self.debug_utils.save_debug_info(self.driver, move_number, board)
-                return False
+            # parse_san checks legality too
+            uci = board.parse_san(move_text)
+            board.push(uci)
+        except chess.IllegalMoveError:
+            logger.warning(f"Move '{move_text}' is not legal in current position")
+            self.debug_utils.save_debug_info(self.driver, move_number, board)
+            return False
         except Exception as e:
             logger.error(f"Invalid move notation '{move_text}': {e}")
             self.debug_utils.save_debug_info(self.driver, move_number, board)
             return False
 
+        move_desc = "us" if is_our_move else "opponent"
+        logger.success(f"{_move_num(move_number)}. {uci.uci()} [{move_desc}]")
+        return True
+
     @move_retry(max_retries=3, delay=1.0)
     def execute_move(self, move: chess.Move, move_number: int) -> None:
         """Execute a move through the interface"""
-        logger.debug(f"Executing move: {move}")
-
-        # Advanced humanized delay before making the move
-        if self.config_manager:
-            advanced_humanized_delay("move execution", self.config_manager, "moving")
-        else:
-            humanized_delay(0.5, 1.5, "move execution")
+        logger.debug("Executing move: {}", move)
 
-        self.clear_arrow()
-
-        # Get fresh move handle to avoid stale element reference
         move_handle = self.get_move_input_handle()
         if not move_handle:
-            logger.error("Failed to get fresh move input handle")
+            logger.error("Failed to get move input handle")
             raise Exception("Could not find move input handle")
 
-        # Advanced humanized typing delay
-        if self.config_manager:
-            advanced_humanized_delay("move input", self.config_manager, "base")
-        else:
-            humanized_delay(0.3, 0.8, "move input")
+        # Moving and typing pauses slept as one humanized delay
+        delay = humanized_total(self.config_manager, ("moving", "base"))
+        logger.debug("Delaying move execution and input for {:.2f}s", delay)
+        sleep(delay)
+
+        # Same order as the separate calls it replaces: Enter flushes any
+        # pending input, select-all stands in for clear(), then the move is
+        # typed, which Lichess plays as soon as it parses; one round-trip
+        keys = (Keys.RETURN, Keys.CONTROL, "a", Keys.NULL, str(move))
 
         # Execute move input with safe execution
         def _send_move_input():
-            move_handle.send_keys(Keys.RETURN)
-            move_handle.clear()
-
-            # Type move with slight delay and additional jitter
-            if self.config_manager:
-                advanced_humanized_delay("typing move", self.config_manager, "base")
-            else:
-                humanized_delay(0.2, 0.5, "typing move")
-
-            move_handle.send_keys(str(move))
+            try:
+                move_handle.send_keys(*keys)
+            except StaleElementReferenceException:
+                # Cached input was re-rendered by the page, look it up again
+                self._move_input = None
+                self.get_move_input_handle().send_keys(*keys)
 
         safe_execute(_send_move_input, log_errors=True)
 
     def clear_arrow(self) -> None:
         """Clear any arrows on the board"""
-        self.browser_manager.execute_script(
-            """
-            var g = document.getElementsByTagName("g")[0];
-            if (g) {
-                g.textContent = "";
-            }
-            """
-        )
+        if not self.arrows_enabled:
+            return
 
-    def draw_arrow(self, move: chess.Move, our_color: str) -> None:
-        """Draw an arrow showing the suggested move"""
-        move_str = str(move)
-        src_square = move_str[:2]
-        dst_square = move_str[2:]
-        logger.debug(f"Drawing move arrow: {src_square} → {dst_square}")
+        self.browser_manager.execute_script(_CLEAR_ARROW_JS)
+        self._arrow_drawn = False
 
-        transform = self._get_piece_transform(move, our_color)
+    def install_arrow_script(self) -> None:
+        """Define the page-side arrow function for this game"""
+        self.browser_manager.execute_script(_ARROW_INSTALL_JS)
+        logger.debug("Installed arrow drawing script")
+
+    def render_arrow(self, move: chess.Move, our_color: str) -> None:
+        """Replace any arrows on the board with one showing the suggested move"""
+        if not self.arrows_enabled:
+            return
 
         move_str = str(move)
-        src = str(move_str[:2])
-        dst = str(move_str[2:])
+        src = move_str[:2]
+        dst = move_str[2:]
+        logger.debug("Drawing move arrow: {} → {}", src, dst)
 
-        board_style = self.driver.find_element(
-            By.XPATH, "/html/body/div[2]/main/div[1]/div[1]/div/cg-container"
-        ).get_attribute("style")
-        board_size = re.search(r"\d+", board_style).group()
+        transform = self._get_piece_transform(move, our_color)
 
-        self.browser_manager.execute_script(
-            """
-            var x1 = arguments[0];
-            var y1 = arguments[1];
-            var x2 = arguments[2];
-            var y2 = arguments[3];
-            var size = arguments[4];
-            var src = arguments[5];
-            var dst = arguments[6];
-
-            defs = document.getElementsByTagName("defs")[0];
-            child_defs = document.getElementsByTagName("marker")[0];
-
-            if (child_defs == null) {
-                child_defs = document.createElementNS("http://www.w3.org/2000/svg", "marker");
-                child_defs.setAttribute("id", "arrowhead-g");
-                child_defs.setAttribute("orient", "auto");
-                child_defs.setAttribute("markerWidth", "4");
-                child_defs.setAttribute("markerHeight", "8");
-                child_defs.setAttribute("refX", "2.05");
-                child_defs.setAttribute("refY", "2.01");
-                child_defs.setAttribute("cgKey", "g");
-                
-                path = document.createElement('path')
-                path.setAttribute("d", "M0,0 V4 L3,2 Z");
-                path.setAttribute("fill", "#15781B");
-                child_defs.appendChild(path);
-                defs.appendChild(child_defs);
-            }
+        # Clear, measure (first arrow only) and draw in a single round-trip
+        args = (*transform, src, dst, self._board_size)
+        board_size = self.browser_manager.execute_script(_ARROW_CALL_JS, *args)
+        if board_size is False:
+            # Page was reloaded or the board SVG rebuilt, define it again and
+            # measure the board afresh
+            self.install_arrow_script()
+            args = (*transform, src, dst, None)
+            board_size = self.browser_manager.execute_script(_ARROW_CALL_JS, *args)
 
-            g = document.getElementsByTagName("g")[0];
-            
-            // Create the main arrow line
-            var child_g = document.createElementNS('http://www.w3.org/2000/svg', 'line');
-            child_g.setAttribute("stroke","#15781B");
-            child_g.setAttribute("stroke-width","0.15625");
-            child_g.setAttribute("stroke-linecap","round");
-            child_g.setAttribute("marker-end","url(#arrowhead-g)");
-            child_g.setAttribute("opacity","1");
-            child_g.setAttribute("x1", x1);
-            child_g.setAttribute("y1", y1);
-            child_g.setAttribute("x2", x2);
-            child_g.setAttribute("y2", y2);
-            child_g.setAttribute("cgHash", `${size}, ${size},` + src + `,` + dst + `,green`);
-            g.appendChild(child_g);
-            
-            // Add subtle destination indicator (small dot)
-            var destIndicator = document.createElementNS('http://www.w3.org/2000/svg', 'circle');
-            destIndicator.setAttribute("cx", x2);
-            destIndicator.setAttribute("cy", y2);
-            destIndicator.setAttribute("r", "0.08");
-            destIndicator.setAttribute("fill", "#FFD700");
-            destIndicator.setAttribute("fill-opacity", "0.9");
-            destIndicator.setAttribute("stroke", "#15781B");
-            destIndicator.setAttribute("stroke-width", "0.02");
-            destIndicator.setAttribute("cgHash", `${size}, ${size},` + src + `,` + dst + `,destination`);
-            g.appendChild(destIndicator);
-            
-            // Add very subtle pulsing to destination
-            var pulseAnim = document.createElementNS('http://www.w3.org/2000/svg', 'animate');
-            pulseAnim.setAttribute("attributeName", "r");
-            pulseAnim.setAttribute("values", "0.08;0.12;0.08");
-            pulseAnim.setAttribute("dur", "2s");
-            pulseAnim.setAttribute("repeatCount", "indefinite");
-            destIndicator.appendChild(pulseAnim);
-            """,
-            transform[0],
-            transform[1],
-            transform[2],
-            transform[3],
-            board_size,
-            src,
-            dst,
-        )
+        if board_size is False:
+            logger.warning("Could not draw move arrow: board SVG not available")
+            self._board_size = None
+            return
+
+        self._board_size = board_size
+        self._arrow_drawn = True
 
     def _get_piece_transform(self, move: chess.Move, our_color: str) -> List[float]:
         """Calculate arrow coordinates for the move"""
-        rank_values_w = [
-            ("a", -3.5),
-            ("b", -2.5),
-            ("c", -1.5),
-            ("d", -0.5),
-            ("e", 0.5),
-            ("f", 1.5),
-            ("g", 2.5),
-            ("h", 3.5),
-        ]
-        file_values_w = [
-            (1, 3.5),
-            (2, 2.5),
-            (3, 1.5),
-            (4, 0.5),
-            (5, -0.5),
-            (6, -1.5),
-            (7, -2.5),
-            (8, -3.5),
-        ]
-
-        rank_values_b = [
-            ("a", 3.5),
-            ("b", 2.5),
-            ("c", 1.5),
-            ("d", 0.5),
-            ("e", -0.5),
-            ("f", -1.5),
-            ("g", -2.5),
-            ("h", -3.5),
-        ]
-        file_values_b = [
-            (1, -3.5),
-            (2, -2.5),
-            (3, -1.5),
-            (4, -0.5),
-            (5, 0.5),
-            (6, 1.5),
-            (7, 2.5),
-            (8, 3.5),
-        ]
+        src_x, src_y = _SQUARE_OFFSETS[move.from_square]
+        dst_x, dst_y = _SQUARE_OFFSETS[move.to_square]
 
-        move_str = str(move)
-        _from = str(move_str[:2])
-        _to = str(move_str[2:])
-
-        # Get source coordinates
-        for i, (rank, value) in enumerate(
-            rank_values_w if our_color == "W" else rank_values_b
-        ):
-            if rank == _from[0]:
-                src_x = value
-                break
-
-        for i, (file, value) in enumerate(
-            file_values_w if our_color == "W" else file_values_b
-        ):
-            if file == int(_from[1]):
-                src_y = value
-                break
-
-        # Get destination coordinates
-        for i, (rank, value) in enumerate(
-            rank_values_w if our_color == "W" else rank_values_b
-        ):
-            if rank == _to[0]:
-                dst_x = value
-                break
-
-        for i, (file, value) in enumerate(
-            file_values_w if our_color == "W" else file_values_b
-        ):
-            if file == int(_to[1]):
-                dst_y = value
-                break
-
-        return [src_x, src_y, dst_x, dst_y]
+        # Board is mirrored when playing as Black
+        sign = 1 if our_color == "W" else -1
+
+        return [sign * src_x, sign * src_y, sign * dst_x, sign * dst_y]
 
     def is_game_over(self) -> bool:
         """Check if game is over (follow-up element exists)"""
-        return bool(
-            safe_execute(
-                self.browser_manager.check_exists_by_class,
-                "follow-up",
-                default_return=False,
-                log_errors=False,
-            )
+        return safe_execute(
+            self.browser_manager.exists_class,
+            "follow-up",
+            default_return=False,
+            log_errors=False,
         )
@@ -1,44 +1,128 @@
-"""Browser Manager - Singleton pattern for WebDriver management"""
+"""Browser Manager - Shared, lazily launched WebDriver management"""
 
 import json
 import os
+import threading
 from typing import Optional
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
 from loguru import logger
 from selenium import webdriver
-from selenium.common.exceptions import NoSuchElementException
-from selenium.webdriver.common.by import By
 
-from ..utils.helpers import get_geckodriver_path, install_firefox_extensions
-from ..utils.resilience import browser_retry, element_retry, safe_execute
+from ..utils.helpers import (
+    get_firefox_profile_path,
+    get_geckodriver_path,
+    install_firefox_extensions,
+)
+from ..utils.resilience import browser_retry
+
+# Firefox prefs that cut network and CPU work unrelated to playing. Images stay
+# enabled because the board pieces are drawn from image sprites
+_FIREFOX_PREFS = {
+    "media.autoplay.default": 5,  # Block all autoplay
+    "network.prefetch-next": False,
+    "network.dns.disablePrefetch": True,
+    "browser.safebrowsing.malware.enabled": False,
+    "browser.safebrowsing.phishing.enabled": False,
+    "browser.safebrowsing.downloads.enabled": False,
+    "datareporting.healthreport.uploadEnabled": False,
+    "datareporting.policy.dataSubmissionEnabled": False,
+    "toolkit.telemetry.enabled": False,
+    "app.update.auto": False,
+}
+
+# Sets every cookie in arguments[0] (Selenium cookie dicts) through document.cookie
+_SET_COOKIES_JS = """
+    arguments[0].forEach(function (c) {
+        var cookie = c.name + "=" + c.value + "; path=" + (c.path || "/");
+        if (c.domain) {
+            cookie += "; domain=" + c.domain;
+        }
+        if (c.expiry) {
+            cookie += "; expires=" + new Date(c.expiry * 1000).toUTCString();
+        }
+        if (c.sameSite) {
+            cookie += "; SameSite=" + c.sameSite;
+        }
+        if (c.secure) {
+            cookie += "; Secure";
+        }
+        document.cookie = cookie;
+    });
+"""
+
+
+def _profile_in_use(profile_dir: str) -> bool:
+    """Whether a running Firefox still holds the profile's parent.lock"""
+    lock_path = os.path.join(profile_dir, "parent.lock")
+    if not os.path.exists(lock_path):
+        return False
+    try:
+        if fcntl is None:
+            # Windows keeps the file open while Firefox runs, so only a stale
+            # lock can be removed
+            os.remove(lock_path)
+        else:
+            with open(lock_path, "a") as f:
+                fcntl.lockf(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                fcntl.lockf(f, fcntl.LOCK_UN)
+        return False
+    except OSError:
+        return True
 
 
 class BrowserManager:
-    """Singleton browser manager for the chess bot"""
-
-    _instance: Optional["BrowserManager"] = None
-    _initialized: bool = False
-
-    def __new__(cls) -> "BrowserManager":
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+    """Browser manager for the chess bot, shared through get_browser()"""
 
     def __init__(self):
-        if not self._initialized:
-            self.driver: Optional[webdriver.Firefox] = None
-            self.cookies_file = os.path.join("deps", "lichess_cookies.json")
-            self._setup_driver()
-            BrowserManager._initialized = True
+        self.driver: Optional[webdriver.Firefox] = None
+        self.cookies_file = os.path.join("deps", "lichess_cookies.json")
+        # Parsed cookies file, reused until the file's mtime changes
+        self._cookies_cache: Optional[list] = None
+        self._cookies_mtime = 0.0
+        self._cookies_size = 0
+        # Firefox is launched on first use, not on construction
+        self._driver_lock = threading.Lock()
+        # Set by close(); no browser may be launched after shutdown began
+        self._closed = False
 
     def _setup_driver(self) -> None:
         """Initialize Firefox WebDriver with options"""
+        if self._closed:
+            raise RuntimeError("Browser manager is closed, not launching Firefox")
+
         try:
             webdriver_options = webdriver.FirefoxOptions()
             webdriver_options.add_argument(
                 f'--user-agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/109.0"'
             )
 
+            # Reuse one profile across runs so Lichess assets stay in the disk
+            # cache. If another or a hung Firefox still holds it, fall back to
+            # a throwaway profile rather than failing to launch
+            profile_dir = os.path.abspath(get_firefox_profile_path())
+            os.makedirs(profile_dir, exist_ok=True)
+            if _profile_in_use(profile_dir):
+                logger.warning(
+                    "Firefox profile {} is locked, using a temporary profile",
+                    profile_dir,
+                )
+            else:
+                webdriver_options.add_argument("-profile")
+                webdriver_options.add_argument(profile_dir)
+                webdriver_options.set_preference("browser.cache.disk.enable", True)
+                webdriver_options.set_preference(
+                    "browser.cache.disk.parent_directory", profile_dir
+                )
+
+            # Skip background subsystems that only slow page loads down
+            for pref, value in _FIREFOX_PREFS.items():
+                webdriver_options.set_preference(pref, value)
+
             firefox_service = webdriver.firefox.service.Service(
                 executable_path=get_geckodriver_path()
             )
@@ -50,47 +134,62 @@ class BrowserManager:
             # Install Firefox extensions
             install_firefox_extensions(self.driver)
 
+            # Lookups must fail fast; waiting is done explicitly where needed
+            self.driver.implicitly_wait(0)
+
             logger.debug("Firefox WebDriver initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize WebDriver: {e}")
             raise
 
-    def get_driver(self) -> webdriver.Firefox:
-        """Get the WebDriver instance"""
+    def ensure_driver(self) -> webdriver.Firefox:
+        """Launch the WebDriver if it is not running yet and return it"""
+        if self._closed:
+            raise RuntimeError("Browser manager is closed")
         if self.driver is None:
-            raise RuntimeError("WebDriver not initialized")
+            with self._driver_lock:
+                if self.driver is None:
+                    self._setup_driver()
         return self.driver
 
+    def get_driver(self) -> webdriver.Firefox:
+        """Get the WebDriver instance, launching it on first use"""
+        return self.ensure_driver()
+
     @browser_retry(max_retries=3, delay=2.0)
     def navigate_to(self, url: str) -> None:
         """Navigate to a URL"""
-        if self.driver:
-            logger.debug(f"Navigating to: {url}")
-            self.driver.get(url)
-        else:
-            raise RuntimeError("WebDriver not initialized")
-
-    @element_retry(max_retries=2, delay=0.5)
-    def check_exists_by_xpath(self, xpath: str):
-        """Check if element exists by XPath"""
-        try:
-            element = self.driver.find_element(By.XPATH, xpath)
-            return element
-        except NoSuchElementException:
-            return False
-
-    @element_retry(max_retries=2, delay=0.5)
-    def check_exists_by_class(self, classname: str):
-        """Check if element exists by class name"""
-        try:
-            element = self.driver.find_element(By.CLASS_NAME, classname)
-            return element
-        except NoSuchElementException:
-            return False
+        driver = self.ensure_driver()
+        logger.debug(f"Navigating to: {url}")
+        driver.get(url)
+
+    def warm_and_load_cookies(self, url: str) -> bool:
+        """Apply saved cookies from a tiny page on the domain, then open url"""
+        # add_cookie needs us on lichess.org, robots.txt gets us there without
+        # rendering a full page that would be thrown away
+        driver = self.ensure_driver()
+        driver.get("https://lichess.org/robots.txt")
+        cookies_loaded = self.load_cookies()
+
+        self.navigate_to(url)
+        return cookies_loaded
+
+    def exists_class(self, classname: str) -> bool:
+        """Check if an element with the class exists, evaluated in the page"""
+        return bool(
+            self.execute_script(
+                "return !!document.getElementsByClassName(arguments[0])[0];",
+                classname,
+            )
+        )
 
     def execute_script(self, script: str, *args):
         """Execute JavaScript in the browser"""
-        return self.driver.execute_script(script, *args)
+        return self.ensure_driver().execute_script(script, *args)
+
+    def execute_async_script(self, script: str, *args):
+        """Execute asynchronous JavaScript in the browser"""
+        return self.ensure_driver().execute_async_script(script, *args)
 
     def save_screenshot(self, filename: str) -> None:
         """Save a screenshot"""
@@ -112,38 +211,61 @@ class BrowserManager:
         if self.driver:
             try:
                 cookies = self.driver.get_cookies()
+                # Compact output, the file is only ever read back by us
                 with open(self.cookies_file, "w") as f:
-                    json.dump(cookies, f, indent=2)
-                logger.debug(f"Saved {len(cookies)} cookies to {self.cookies_file}")
+                    json.dump(cookies, f, separators=(",", ":"))
+                stat = os.stat(self.cookies_file)
+                self._cookies_cache = cookies
+                self._cookies_mtime = stat.st_mtime
+                self._cookies_size = stat.st_size
+                logger.debug("Saved {} cookies to {}", len(cookies), self.cookies_file)
             except Exception as e:
                 logger.error(f"Failed to save cookies: {e}")
 
+    def _read_cookies_file(self) -> list:
+        """Read the saved cookies, re-parsing only when the file has changed"""
+        with open(self.cookies_file, "r") as f:
+            # One fstat on the open file gives both the mtime and the size
+            stat = os.fstat(f.fileno())
+            self._cookies_size = stat.st_size
+            if self._cookies_cache is None or stat.st_mtime != self._cookies_mtime:
+                self._cookies_cache = json.load(f)
+                self._cookies_mtime = stat.st_mtime
+        return self._cookies_cache
+
     def load_cookies(self) -> bool:
         """Load cookies from file and apply them"""
-        if not os.path.exists(self.cookies_file):
-            logger.info("No saved cookies found")
-            return False
-
         try:
-            with open(self.cookies_file, "r") as f:
-                cookies = json.load(f)
+            cookies = self._read_cookies_file()
 
             # Must be on the correct domain to add cookies
             if self.driver and self.current_url.startswith("https://lichess.org"):
-                for cookie in cookies:
+                # document.cookie cannot set HttpOnly cookies, those go through
+                # WebDriver one by one; the rest are set in a single script
+                native_cookies = [c for c in cookies if c.get("httpOnly")]
+                script_cookies = [c for c in cookies if not c.get("httpOnly")]
+                if script_cookies:
+                    self.execute_script(_SET_COOKIES_JS, script_cookies)
+
+                for cookie in native_cookies:
                     try:
                         self.driver.add_cookie(cookie)
                     except Exception as e:
                         logger.debug(
-                            f"Failed to add cookie {cookie.get('name', 'unknown')}: {e}"
+                            "Failed to add cookie {}: {}",
+                            cookie.get("name", "unknown"),
+                            e,
                         )
 
-                logger.debug(f"Loaded {len(cookies)} cookies")
+                logger.debug("Loaded {} cookies", len(cookies))
                 return True
             else:
                 logger.debug("Cannot load cookies - not on Lichess domain")
                 return False
 
+        except FileNotFoundError:
+            logger.info("No saved cookies found")
+            return False
         except Exception as e:
             logger.error(f"Failed to load cookies: {e}")
             return False
@@ -157,28 +279,27 @@ class BrowserManager:
                 logger.debug("Cleared browser cookies")
 
             # Clear saved cookies file
-            if os.path.exists(self.cookies_file):
+            self._cookies_cache = None
+            try:
                 os.remove(self.cookies_file)
                 logger.debug("Cleared saved cookies file")
+            except FileNotFoundError:
+                pass
         except Exception as e:
             logger.error(f"Failed to clear cookies: {e}")
 
     def get_cookies_info(self) -> dict:
         """Get information about saved cookies"""
-        if not os.path.exists(self.cookies_file):
-            return {"exists": False, "count": 0, "file_size": 0}
-
         try:
-            with open(self.cookies_file, "r") as f:
-                cookies = json.load(f)
-
-            file_size = os.path.getsize(self.cookies_file)
+            cookies = self._read_cookies_file()
             return {
                 "exists": True,
                 "count": len(cookies),
-                "file_size": file_size,
+                "file_size": self._cookies_size,
                 "file_path": self.cookies_file,
             }
+        except FileNotFoundError:
+            return {"exists": False, "count": 0, "file_size": 0}
         except Exception as e:
             logger.error(f"Failed to read cookies info: {e}")
             return {"exists": True, "count": 0, "file_size": 0, "error": str(e)}
@@ -189,41 +310,60 @@ class BrowserManager:
             return False
 
         try:
-            # Look for user menu or account indicator
-            user_indicators = [
-                "#user_tag",  # User menu
-                ".site-title .user",  # Username in header
-                "[data-icon='H']",  # User icon
-                ".dasher .toggle",  # Dasher menu
-            ]
-
-            for selector in user_indicators:
-                try:
-                    element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    if element and element.text.strip():
-                        logger.debug(f"Login detected via selector: {selector}")
-                        return True
-                except:
-                    continue
-
-            # Check page source for login indicators
-            page_source = self.driver.page_source.lower()
-            if any(
-                indicator in page_source
-                for indicator in ["logout", "preferences", "profile"]
-            ):
-                logger.debug("Login detected via page source")
+            # Selector and page-text checks run in the page, so the DOM is never
+            # serialized back to Python the way page_source would
+            detected_by = self.execute_script(
+                """
+                var userIndicators = [
+                    "#user_tag",  // User menu
+                    ".site-title .user",  // Username in header
+                    "[data-icon='H']",  // User icon
+                    ".dasher .toggle",  // Dasher menu
+                ];
+                for (var i = 0; i < userIndicators.length; i++) {
+                    var e = document.querySelector(userIndicators[i]);
+                    if (e && e.textContent.trim()) {
+                        return userIndicators[i];
+                    }
+                }
+
+                var text = document.body.innerHTML.toLowerCase();
+                var found = ["logout", "preferences", "profile"].some(function (s) {
+                    return text.indexOf(s) >= 0;
+                });
+                return found ? "page source" : null;
+                """
+            )
+
+            if detected_by:
+                logger.debug("Login detected via {}", detected_by)
                 return True
 
             return False
 
         except Exception as e:
-            logger.debug(f"Error checking login status: {e}")
+            logger.debug("Error checking login status: {}", e)
             return False
 
     def close(self) -> None:
-        """Close the browser"""
-        if self.driver:
+        """Close the browser; later driver access raises instead of relaunching"""
+        with self._driver_lock:
+            self._closed = True
+            driver, self.driver = self.driver, None
+        if driver:
             logger.info("Closing browser, press Ctrl+C to force quit")
-            self.driver.quit()
-            self.driver = None
+            driver.quit()
+
+
+_browser: Optional[BrowserManager] = None
+_browser_lock = threading.Lock()
+
+
+def get_browser() -> BrowserManager:
+    """Get the shared browser manager, creating it on first call"""
+    global _browser
+    if _browser is None:
+        with _browser_lock:
+            if _browser is None:
+                _browser = BrowserManager()
+    return _browser
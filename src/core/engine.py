@@ -1,5 +1,7 @@
 """Chess Engine - Stockfish integration"""
 
+import os
+import shutil
 from typing import Any, Dict, Optional
 
 import chess
@@ -13,9 +15,21 @@ from ..utils.resilience import retry_on_exception, safe_execute
 class ChessEngine:
     """Chess engine wrapper for Stockfish"""
 
+    # Seconds a liveness ping may take before the engine counts as hung
+    _PING_TIMEOUT = 1.0
+    # Consecutive restarts without a successful search before giving up
+    _MAX_RESTARTS = 3
+
     def __init__(self, config_manager: ConfigManager):
         self.config_manager = config_manager
         self.engine: Optional[chess.engine.SimpleEngine] = None
+        self._default_depth = 5
+        # Set when an engine call fails, so the next call checks liveness first
+        self._engine_suspect = False
+        # Restarts since the last successful search
+        self._restart_count = 0
+        # python-chess sends ucinewgame whenever this key changes
+        self._game = object()
         self._initialize_engine()
 
     def _initialize_engine(self) -> None:
@@ -28,8 +42,12 @@ class ChessEngine:
             if not engine_path:
                 raise ValueError("Engine path not found in config")
 
+            # Cheap existence check instead of spawning the binary to probe it
+            if not os.path.isfile(engine_path) and not shutil.which(engine_path):
+                raise FileNotFoundError(f"Engine binary not found: {engine_path}")
+
             self.engine = chess.engine.SimpleEngine.popen_uci(engine_path)
-            logger.debug(f"Started chess engine: {engine_path}")
+            logger.debug("Started chess engine: {}", engine_path)
 
             # Configure engine options using standardized hyphenated keys
             skill_level = int(
@@ -42,6 +60,11 @@ class ChessEngine:
             )
             hash_size = int(engine_config.get("hash", engine_config.get("Hash", 2048)))
 
+            # Resolved once here rather than on every get_best_move call
+            self._default_depth = int(
+                engine_config.get("depth", engine_config.get("Depth", 5))
+            )
+
             options = {
                 "Skill Level": skill_level,
                 "Hash": hash_size,
@@ -49,13 +72,47 @@ class ChessEngine:
 
             self.engine.configure(options)
             logger.debug(
-                f"Engine configured - Skill: {options['Skill Level']}, Hash: {options['Hash']}"
+                "Engine configured - Skill: {}, Hash: {}",
+                options["Skill Level"],
+                options["Hash"],
             )
 
         except Exception as e:
             logger.error(f"Failed to start chess engine: {e}")
             raise
 
+    def _ensure_engine(self) -> None:
+        """Make sure a responsive engine is running, respawning only if needed"""
+        if self.engine and not self._engine_suspect:
+            return
+
+        if self.engine:
+            # A single failed command usually leaves the engine alive; a hung
+            # one must not stall the move for SimpleEngine's default timeout
+            timeout, self.engine.timeout = self.engine.timeout, self._PING_TIMEOUT
+            try:
+                self.engine.ping()
+                self.engine.timeout = timeout
+                self._engine_suspect = False
+                logger.debug("Engine still responsive, reusing it")
+                return
+            except Exception as e:
+                logger.warning(f"Engine not responding ({e}), restarting it")
+                safe_execute(self.engine.quit, log_errors=False)
+                self.engine = None
+        else:
+            logger.warning("Engine not initialized, attempting to reinitialize")
+
+        if self._restart_count >= self._MAX_RESTARTS:
+            raise RuntimeError(
+                f"Engine failed {self._restart_count} restarts in a row, giving up"
+            )
+
+        self._restart_count += 1
+        self._initialize_engine()
+        self._engine_suspect = False
+        logger.debug("Engine restarted ({} restarts so far)", self._restart_count)
+
     @retry_on_exception(
         max_retries=3,
         delay=1.0,
@@ -65,32 +122,32 @@ class ChessEngine:
         self, board: chess.Board, depth: Optional[int] = None
     ) -> chess.engine.PlayResult:
         """Get the best move for the current position"""
-        if not self.engine:
-            logger.warning("Engine not initialized, attempting to reinitialize")
-            self._initialize_engine()
+        self._ensure_engine()
 
         if depth is None:
-            # Use standardized hyphenated key with backward compatibility
-            depth = int(
-                self.config_manager.get(
-                    "engine", "depth", self.config_manager.get("engine", "Depth", 5)
-                )
-            )
+            depth = self._default_depth
 
-        logger.debug(f"Calculating best move (depth: {depth})")
+        logger.debug("Calculating best move (depth: {})", depth)
 
-        # Get both move and evaluation
-        result = self.engine.play(
-            board,
-            chess.engine.Limit(depth=depth),
-            game=object,
-            info=chess.engine.INFO_ALL,  # Request all info including evaluation
-        )
+        try:
+            # Get both move and evaluation
+            result = self.engine.play(
+                board,
+                chess.engine.Limit(depth=depth),
+                game=self._game,
+                info=chess.engine.INFO_ALL,  # Request all info including evaluation
+            )
 
-        # Get detailed analysis for evaluation
-        analysis = self.engine.analyse(
-            board, chess.engine.Limit(depth=depth), info=chess.engine.INFO_ALL
-        )
+            # Get detailed analysis for evaluation
+            analysis = self.engine.analyse(
+                board,
+                chess.engine.Limit(depth=depth),
+                game=self._game,
+                info=chess.engine.INFO_ALL,
+            )
+        except (chess.engine.EngineError, chess.engine.EngineTerminatedError):
+            self._engine_suspect = True
+            raise
 
         # Add evaluation to result
         if hasattr(result, "info"):
@@ -98,7 +155,8 @@ class ChessEngine:
         else:
             result.info = analysis
 
-        logger.debug(f"Engine suggests: {result.move}")
+        self._restart_count = 0
+        logger.debug("Engine suggests: {}", result.move)
         return result
 
     @retry_on_exception(
@@ -110,14 +168,28 @@ class ChessEngine:
         self, board: chess.Board, time_limit: float = 1.0
     ) -> Dict[str, Any]:
         """Analyze the current position"""
-        if not self.engine:
-            logger.warning("Engine not initialized, attempting to reinitialize")
-            self._initialize_engine()
+        self._ensure_engine()
 
-        info = self.engine.analyse(board, chess.engine.Limit(time=time_limit))
+        try:
+            info = self.engine.analyse(
+                board, chess.engine.Limit(time=time_limit), game=self._game
+            )
+        except (chess.engine.EngineError, chess.engine.EngineTerminatedError):
+            self._engine_suspect = True
+            raise
 
         return info
 
+    def set_depth(self, depth: int) -> None:
+        """Change the search depth used when none is passed to get_best_move"""
+        self._default_depth = int(depth)
+        logger.debug("Engine depth set to {}", self._default_depth)
+
+    def new_game(self) -> None:
+        """Start a new game on the running engine instead of respawning it"""
+        self._game = object()
+        logger.debug("Engine will start a new game on the next search")
+
     def is_running(self) -> bool:
         """Check if engine is running"""
         return self.engine is not None
@@ -1,40 +1,77 @@
 """Game Manager - Main game flow and logic orchestration"""
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from time import sleep
 
 import chess
 from loguru import logger
-from selenium.webdriver.common.by import By
 
 from ..auth.lichess import LichessAuth
 from ..config import ConfigManager
 from ..core.board import BoardHandler
-from ..core.browser import BrowserManager
+from ..core.browser import get_browser
 from ..core.engine import ChessEngine
 from ..input.keyboard_handler import KeyboardHandler
 from ..utils.debug import DebugUtils
 from ..utils.helpers import advanced_humanized_delay
 from ..utils.resilience import (
     BrowserRecoveryManager,
-    browser_retry,
     safe_execute,
     validate_game_state,
-    with_browser_recovery,
 )
 
+# Score and result reason from the end-of-game panel in one round trip
+_GAME_RESULT_JS = """
+const p = document.querySelectorAll('rm6 l4x > div > p');
+return p.length ? [p[0].innerText, p[1] ? p[1].innerText : ''] : null;
+"""
+
 
 class GameManager:
     """Manages the overall game flow and coordinates all components"""
 
+    __slots__ = (
+        "config_manager",
+        "browser_manager",
+        "debug_utils",
+        "board_handler",
+        "chess_engine",
+        "keyboard_handler",
+        "lichess_auth",
+        "browser_recovery_manager",
+        "board",
+        "current_game_active",
+        "gui_callback",
+        "_engine_pool",
+        "_engine_future",
+        "_engine_ply",
+        "_skip_our_check",
+        "_drift_count",
+        "_current_suggestion",
+        "_arrow_drawn",
+        "_our_color",
+        "_our_color_int",
+        "_cfg_depth",
+        "_cfg_autoplay",
+        "_cfg_show_arrow",
+        "_cfg_move_key",
+    )
+
     def __init__(self):
         # Initialize all components
         self.config_manager = ConfigManager()
-        self.browser_manager = BrowserManager()
+        self.browser_manager = get_browser()
         self.debug_utils = DebugUtils()
         self.board_handler = BoardHandler(
             self.browser_manager, self.debug_utils, self.config_manager
         )
         self.chess_engine = ChessEngine(self.config_manager)
+        # Single worker so engine searches never overlap
+        self._engine_pool = ThreadPoolExecutor(max_workers=1)
+        self._engine_future = None
+        self._engine_ply = -1
+        self._skip_our_check = False
+        self._drift_count = 0
         self.keyboard_handler = KeyboardHandler(self.config_manager)
         self.lichess_auth = LichessAuth(self.config_manager, self.browser_manager)
 
@@ -45,10 +82,28 @@ class GameManager:
         self.current_game_active = False
         self._current_suggestion = None
         self._arrow_drawn = False
+        self._our_color = "unknown"
+        self._our_color_int = chess.WHITE
+        self._load_config_cache()
 
         # GUI integration
         self.gui_callback = None
 
+    def _load_config_cache(self) -> None:
+        """Cache config values read on every ply"""
+        self._cfg_depth = int(
+            self.config_manager.get(
+                "engine", "depth", self.config_manager.get("engine", "Depth", 5)
+            )
+        )
+        self._cfg_autoplay = self.config_manager.is_autoplay_enabled
+        self._cfg_show_arrow = self.config_manager.show_arrow
+        self._cfg_move_key = self.config_manager.move_key
+
+        # Components read the same snapshot, so the GUI never shows stale values
+        self.chess_engine.set_depth(self._cfg_depth)
+        self.board_handler.arrows_enabled = self._cfg_show_arrow
+
     def start(self) -> None:
         """Start the chess bot application"""
         logger.info("Starting chess bot application")
@@ -66,15 +121,19 @@ class GameManager:
         logger.debug("Starting keyboard listener")
         self.keyboard_handler.start_listening()
 
-        # Navigate to Lichess with recovery
+        # Navigate to Lichess with recovery, applying saved cookies on the way
         logger.debug("Navigating to lichess.org")
         try:
-            self.browser_manager.navigate_to("https://www.lichess.org")
+            cookies_loaded = self.browser_manager.warm_and_load_cookies(
+                "https://www.lichess.org"
+            )
         except Exception as e:
             logger.error(f"Failed to navigate to Lichess: {e}")
             if self.browser_recovery_manager.attempt_browser_recovery():
                 logger.info("Retrying navigation after browser recovery")
-                self.browser_manager.navigate_to("https://www.lichess.org")
+                cookies_loaded = self.browser_manager.warm_and_load_cookies(
+                    "https://www.lichess.org"
+                )
             else:
                 raise
 
@@ -82,23 +141,33 @@ class GameManager:
         cookie_info = self.browser_manager.get_cookies_info()
         if cookie_info["exists"]:
             logger.debug(
-                f"Found saved cookies ({cookie_info['count']} cookies, {cookie_info['file_size']} bytes)"
+                "Found saved cookies ({} cookies, {} bytes)",
+                cookie_info["count"],
+                cookie_info["file_size"],
             )
         else:
             logger.debug("No saved cookies found - will use username/password login")
 
         # Sign in
-        if not self.lichess_auth.sign_in():
+        if not self.lichess_auth.sign_in(cookies_loaded):
             logger.error("Failed to sign in to Lichess")
             return
 
-        # Start game loop
+        # Start game loop, one iteration per game
         logger.info("Waiting for game to start")
-        self.start_new_game()
+        while True:
+            self.start_new_game()
+            if not self.current_game_active:
+                break
 
     def start_new_game(self) -> None:
         """Start a new game with enhanced error handling"""
         logger.debug("Starting new game - resetting board")
+        self._load_config_cache()
+        self._engine_future = None
+        self._skip_our_check = False
+        self._drift_count = 0
+        self.chess_engine.new_game()
         self.board.reset()
         self.current_game_active = True
 
@@ -116,6 +185,7 @@ class GameManager:
                         sleep(2)
                     else:
                         logger.error("Failed to wait for game ready after all attempts")
+                        self.current_game_active = False
                         return
             except Exception as e:
                 logger.error(
@@ -129,6 +199,7 @@ class GameManager:
                     continue
                 else:
                     logger.error("Failed to start new game")
+                    self.current_game_active = False
                     return
 
         # Determine our color with fallback
@@ -160,20 +231,21 @@ class GameManager:
         except Exception as e:
             logger.error(f"Game play failed: {e}")
             self.debug_utils.save_debug_info(self.browser_manager.driver, 0, self.board)
-            # Attempt recovery and restart
+            # Attempt recovery; the caller's loop restarts the game
             if self.browser_recovery_manager.attempt_browser_recovery():
                 logger.info("Attempting to restart game after recovery")
-                self.start_new_game()
             else:
                 logger.error("Could not recover from game error")
+                self.current_game_active = False
 
     def play_game(self, our_color: str) -> None:
         """Main game playing loop"""
-        logger.debug(f"Starting play_game as {our_color}")
+        logger.debug("Starting play_game as {}", our_color)
+        self._our_color_int = chess.WHITE if our_color == "W" else chess.BLACK
 
         # Get previous moves to sync board state
         move_number = self.board_handler.get_previous_moves(self.board)
-        logger.debug(f"Ready to play. Starting at move number: {move_number}")
+        logger.debug("Ready to play. Starting at move number: {}", move_number)
 
         # Save cookies after successful game start (indicates successful login)
         logger.debug("Saving login cookies for faster future authentication")
@@ -189,7 +261,7 @@ class GameManager:
                 )
         else:
             # Joined game in progress - check if it's immediately our turn
-            if self._is_our_turn(our_color):
+            if self._is_our_turn():
                 logger.info(
                     f"Joined game in progress - it's our turn to play move {move_number}"
                 )
@@ -223,7 +295,7 @@ class GameManager:
                             logger.error("Could not recover browser, exiting game")
                             break
 
-                our_turn = self._is_our_turn(our_color)
+                our_turn = self._is_our_turn()
                 previous_move_number = move_number
 
                 if our_turn:
@@ -268,25 +340,28 @@ class GameManager:
         logger.debug("Game completed - follow-up element detected")
         self._log_game_result()
         logger.info("Game complete. Waiting for new game to start.")
-        self.start_new_game()
 
-    def _is_our_turn(self, our_color: str) -> bool:
+    def _is_our_turn(self) -> bool:
         """Check if it's our turn to move"""
-        return (self.board.turn and our_color == "W") or (
-            not self.board.turn and our_color == "B"
-        )
+        return self.board.turn == self._our_color_int
 
     def _handle_our_turn(self, move_number: int, our_color: str) -> int:
         """Handle our turn logic"""
-        # Check if we already made the move
-        move_text = self.board_handler.check_for_move(move_number)
+        # Check if we already made the move, unless the opponent only just moved
+        if self._skip_our_check:
+            self._skip_our_check = False
+            move_text = None
+        else:
+            move_text = self.board_handler.check_for_move(move_number)
         if move_text:
-            logger.debug(f"Our move detected on board at position {move_number}")
+            logger.debug("Our move detected on board at position {}", move_number)
             self.board_handler.clear_arrow()
+            self._engine_future = None
 
             if self.board_handler.validate_and_push_move(
                 self.board, move_text, move_number, True
             ):
+                self._drift_count = 0
                 # Get the last move that was pushed
                 last_move = self.board.peek() if self.board.move_stack else None
                 if last_move:
@@ -302,19 +377,27 @@ class GameManager:
                     )
                 return move_number + 1
             else:
-                return move_number
+                return self._on_rejected_move(move_number)
 
         # Get best move from engine
-        engine_depth = self.config_manager.get(
-            "engine", "depth", self.config_manager.get("engine", "Depth", 5)
+        engine_depth = self._cfg_depth
+        logger.debug("Our turn - calculating best move (depth: {})", engine_depth)
+        # The search runs in the background while the thinking delay elapses
+        future = self._request_best_move()
+        advanced_humanized_delay(
+            "engine thinking",
+            self.config_manager,
+            "thinking",
+            cancel_event=self.keyboard_handler.move_event,
         )
-        logger.debug(f"Our turn - calculating best move (depth: {engine_depth})")
-        advanced_humanized_delay("engine thinking", self.config_manager, "thinking")
 
-        result = self.chess_engine.get_best_move(self.board)
-        move_str = str(result.move)
-        src_square = move_str[:2]
-        dst_square = move_str[2:]
+        try:
+            result = future.result()
+        except Exception:
+            self._engine_future = None
+            raise
+        src_square = chess.SQUARE_NAMES[result.move.from_square]
+        dst_square = chess.SQUARE_NAMES[result.move.to_square]
         logger.info(f"Engine suggests: {result.move} ({src_square} → {dst_square})")
 
         # Notify GUI of suggestion
@@ -336,23 +419,38 @@ class GameManager:
         )
 
         # Handle move execution based on mode
-        if self.config_manager.is_autoplay_enabled:
+        if self._cfg_autoplay:
             return self._execute_auto_move(result.move, move_number, our_color)
         else:
             return self._handle_manual_move(result.move, move_number, our_color)
 
+    def _request_best_move(self) -> Future:
+        """Start an engine search for the current position unless one is running"""
+        ply = len(self.board.move_stack)
+        if self._engine_future is None or self._engine_ply != ply:
+            self._engine_future = self._engine_pool.submit(
+                self.chess_engine.get_best_move, self.board.copy()
+            )
+            self._engine_ply = ply
+        return self._engine_future
+
     def _execute_auto_move(
         self, move: chess.Move, move_number: int, our_color: str
     ) -> int:
         """Execute move automatically"""
-        logger.debug(f"Making move: {move}")
+        logger.debug("Making move: {}", move)
 
         # Show arrow briefly if enabled, even in autoplay
-        if self.config_manager.show_arrow:
+        if self._cfg_show_arrow:
             logger.debug("Showing move arrow before auto execution")
-            self.board_handler.draw_arrow(move, our_color)
+            self.board_handler.render_arrow(move, our_color)
             # Brief delay to show the arrow
-            advanced_humanized_delay("showing arrow", self.config_manager, "base")
+            advanced_humanized_delay(
+                "showing arrow",
+                self.config_manager,
+                "base",
+                cancel_event=self.keyboard_handler.move_event,
+            )
 
         self.board_handler.execute_move(move, move_number)
         self.board.push(move)
@@ -382,15 +480,31 @@ class GameManager:
     ) -> int:
         """Handle manual move execution"""
         # Show arrow if enabled (only draw once per turn)
-        if not hasattr(self, "_current_suggestion") or self._current_suggestion != move:
+        if self._current_suggestion != move:
             self._current_suggestion = move
             self._arrow_drawn = False
 
-        if self.config_manager.show_arrow and not self._arrow_drawn:
+        if self._cfg_show_arrow and not self._arrow_drawn:
             logger.debug("Showing move suggestion arrow")
-            self.board_handler.draw_arrow(move, our_color)
+            self.board_handler.render_arrow(move, our_color)
             self._arrow_drawn = True
 
+        if not self.keyboard_handler.should_make_move():
+            # Just suggesting - show the move and wait
+            move_key = self._cfg_move_key
+            src_square = chess.SQUARE_NAMES[move.from_square]
+            dst_square = chess.SQUARE_NAMES[move.to_square]
+            logger.info(
+                "Suggest move: {} ({} → {}) - press {} to execute",
+                move,
+                src_square,
+                dst_square,
+                move_key,
+            )
+            # Wakes as soon as the key is pressed; the timeout lets the loop
+            # notice a move played on the board or the game ending
+            self.keyboard_handler.wait_for_move_key(timeout=1.0)
+
         # Check for key press
         if self.keyboard_handler.should_make_move():
             logger.info(f"Manual key press detected - making move: {move}")
@@ -422,33 +536,20 @@ class GameManager:
             )
 
             return move_number + 1
-        else:
-            # Just suggesting - show the move and wait
-            move_key = self.config_manager.move_key
-            move_str = str(move)
-            src_square = move_str[:2]
-            dst_square = move_str[2:]
-            logger.debug(
-                f"Suggesting move: {move} ({src_square} → {dst_square}) (press {move_key} to execute)"
-            )
-            logger.info(
-                f"Suggest move: {move} ({src_square} → {dst_square}) - press {move_key} to execute"
-            )
-            sleep(0.1)  # Small delay to avoid spam
 
-            return move_number
+        return move_number
 
     def _handle_opponent_turn(self, move_number: int) -> int:
         """Handle opponent's turn"""
-        self.board_handler.clear_arrow()
-
-        move_text = self.board_handler.check_for_move(move_number)
+        # Clears our arrow (if any) and returns as soon as the move appears
+        move_text = self.board_handler.poll_opponent(move_number)
         if move_text:
             logger.info(f"Opponent move detected at position {move_number}")
 
             if self.board_handler.validate_and_push_move(
                 self.board, move_text, move_number, False
             ):
+                self._drift_count = 0
                 # Get the last move from board stack (it was just pushed)
                 last_move = self.board.peek() if self.board.move_stack else None
 
@@ -464,6 +565,12 @@ class GameManager:
                     }
                 )
 
+                # Start thinking about our reply straight away; our move
+                # cannot be on the page yet, so skip looking for it once
+                if not self.board.is_game_over():
+                    self._request_best_move()
+                    self._skip_our_check = True
+
                 # Notify GUI of move played for history
                 if last_move:
                     self._notify_gui(
@@ -477,31 +584,42 @@ class GameManager:
 
                 return move_number + 1
 
+            return self._on_rejected_move(move_number)
+
+        return move_number
+
+    def _on_rejected_move(self, move_number: int) -> int:
+        """Count a rejected move and replay the page's move list once it repeats"""
+        self._drift_count += 1
+        if self._drift_count < 2:
+            return move_number
+
+        logger.warning("Board out of sync with the page, replaying the move list")
+        self._drift_count = 0
+        self._engine_future = None
+        move_number = self.board_handler.resync_from_dom(self.board)
+        self._notify_gui(
+            {
+                "type": "board_update",
+                "board": self.board,
+                "last_move": self.board.peek() if self.board.move_stack else None,
+            }
+        )
         return move_number
 
     def _log_game_result(self) -> None:
         """Log the game result when game ends"""
         try:
-            # Get score using driver directly
-            score_element = self.browser_manager.driver.find_element(
-                By.XPATH, "/html/body/div[2]/main/div[1]/rm6/l4x/div/p[1]"
-            )
-            score = score_element.text if score_element else "Score not found"
-
-            # Get result reason using driver directly
-            result_element = self.browser_manager.driver.find_element(
-                By.XPATH, "/html/body/div[2]/main/div[1]/rm6/l4x/div/p[2]"
-            )
-            result = result_element.text if result_element else "Result not found"
+            texts = self.browser_manager.execute_script(_GAME_RESULT_JS)
+            if not texts:
+                raise ValueError("result panel not found")
+            score = texts[0] or "Score not found"
+            result = texts[1] or "Result not found"
 
             logger.success(f"GAME FINISHED - {score} | {result}")
 
             # Get our color for result interpretation
-            our_color = (
-                "white"
-                if hasattr(self, "_our_color") and self._our_color == "W"
-                else "black"
-            )
+            our_color = "white" if self._our_color == "W" else "black"
 
             # Get move count from history
             move_count = len(self.board.move_stack)
@@ -518,7 +636,7 @@ class GameManager:
             )
 
         except Exception as e:
-            logger.debug(f"Could not extract game result: {e}")
+            logger.debug("Could not extract game result: {}", e)
             logger.info("GAME FINISHED - Result details not available")
 
             # Still notify GUI even if we couldn't get details
@@ -527,7 +645,7 @@ class GameManager:
                     "type": "game_finished",
                     "score": "Game completed",
                     "reason": "Result details not available",
-                    "our_color": getattr(self, "_our_color", "unknown"),
+                    "our_color": self._our_color,
                     "move_count": len(self.board.move_stack) if self.board else 0,
                 }
             )
@@ -547,6 +665,7 @@ class GameManager:
     def cleanup(self) -> None:
         """Clean up resources with enhanced error handling"""
         logger.info("Cleaning up resources")
+        self.current_game_active = False
 
         # Clean up keyboard handler
         if self.keyboard_handler:
@@ -556,6 +675,9 @@ class GameManager:
                 default_return=None,
             )
 
+        # Stop any pending search before shutting the engine down
+        self._engine_pool.shutdown(wait=False, cancel_futures=True)
+
         # Clean up chess engine
         if self.chess_engine:
             safe_execute(self.chess_engine.quit, log_errors=True, default_return=None)
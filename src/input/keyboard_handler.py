@@ -1,5 +1,6 @@
 """Keyboard Handler - Input management"""
 
+import threading
 from typing import Callable, Optional
 
 from loguru import logger
@@ -20,6 +21,8 @@ class KeyboardHandler:
         self.on_move_key_press = on_move_key_press
         self.listener: Optional[keyboard.Listener] = None
         self.make_move = False
+        # Set on move key press so waiters wake up instead of polling the flag
+        self.move_event = threading.Event()
 
     def on_press(self, key) -> None:
         """Handle key press events"""
@@ -28,6 +31,7 @@ class KeyboardHandler:
 
         if key_string == move_key or key_string == "Key." + move_key:
             self.make_move = True
+            self.move_event.set()
             logger.debug(f"Move key pressed: {move_key}")
             if self.on_move_key_press:
                 self.on_move_key_press()
@@ -39,6 +43,7 @@ class KeyboardHandler:
 
         if key_string == move_key or key_string == "Key." + move_key:
             self.make_move = False
+            self.move_event.clear()
             logger.debug(f"Move key released: {move_key}")
 
     def start_listening(self) -> None:
@@ -61,6 +66,11 @@ class KeyboardHandler:
         """Check if move key is currently pressed"""
         return self.make_move
 
+    def wait_for_move_key(self, timeout: float) -> bool:
+        """Block until the move key is pressed or timeout seconds pass"""
+        return self.move_event.wait(timeout)
+
     def reset_move_state(self) -> None:
         """Reset the move state"""
         self.make_move = False
+        self.move_event.clear()
@@ -7,6 +7,7 @@ from .helpers import (
     get_geckodriver_path,
     get_stockfish_path,
     humanized_delay,
+    humanized_total,
 )
 from .resilience import (
     BrowserRecoveryManager,
@@ -26,6 +27,7 @@ __all__ = [
     "get_stockfish_path",
     "humanized_delay",
     "advanced_humanized_delay",
+    "humanized_total",
     "clear_screen",
     "BrowserRecoveryManager",
     "CircuitBreaker",
@@ -7,6 +7,7 @@ from typing import Optional
 
 import chess
 from loguru import logger
+from selenium.common.exceptions import StaleElementReferenceException
 
 
 class DebugUtils:
@@ -121,7 +122,7 @@ class DebugUtils:
                         logger.info(
                             f"  [{i}] Tag: {tag}, Classes: {classes}, Text: '{text}'"
                         )
-                    except:
+                    except StaleElementReferenceException:
                         logger.debug(f"  [{i}] Could not get element info")
             except Exception as e:
                 logger.debug(f"Selector '{selector}' failed: {e}")
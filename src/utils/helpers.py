@@ -4,7 +4,9 @@ import os
 import platform
 import random
 import sys
+import threading
 from time import sleep
+from typing import Optional
 
 from loguru import logger
 
@@ -27,6 +29,11 @@ def get_stockfish_path() -> str:
         return os.path.join("deps", "stockfish", "stockfish")
 
 
+def get_firefox_profile_path() -> str:
+    """Get the persistent Firefox profile directory"""
+    return os.path.join("deps", "ff_profile")
+
+
 def get_xpath_finder_path() -> str:
     """Get the xpath_finder extension path"""
     return os.path.join("deps", "xpath_finder.xpi")
@@ -45,6 +52,45 @@ def install_firefox_extensions(driver):
             logger.warning(f"Failed to install extension {extension_path}: {e}")
 
 
+def _humanized_delay_seconds(min_seconds: float, max_seconds: float) -> float:
+    """Compute a humanized delay with jitter, without sleeping"""
+    # Base delay from config
+    base_delay = random.uniform(min_seconds, max_seconds)
+
+    # Add jitter (0-1 seconds additional randomness)
+    jitter = random.uniform(0, 1.0)
+
+    # Micro-variations to make it more human-like
+    micro_variation = random.uniform(-0.1, 0.1)
+
+    # Final delay with all variations, at least 0.1s
+    return max(0.1, base_delay + jitter + micro_variation)
+
+
+def _advanced_delay_seconds(min_seconds: float, max_seconds: float) -> float:
+    """Compute an advanced humanized delay, without sleeping"""
+    # Advanced human-like patterns
+    base_delay = random.uniform(min_seconds, max_seconds)
+
+    # Add multiple layers of randomness
+    jitter_1 = random.uniform(0, 0.8)  # Primary jitter
+    jitter_2 = random.uniform(0, 0.3)  # Secondary jitter
+
+    # Occasional longer pauses (10% chance)
+    if random.random() < 0.1:
+        pause_bonus = random.uniform(0.5, 1.5)
+        logger.debug(f"Adding thinking pause: {pause_bonus:.2f}s")
+    else:
+        pause_bonus = 0
+
+    # Micro-hesitations
+    micro_hesitation = random.uniform(-0.05, 0.15)
+
+    # Final calculation
+    final_delay = base_delay + jitter_1 + jitter_2 + pause_bonus + micro_hesitation
+    return max(0.1, final_delay)
+
+
 def humanized_delay(
     min_seconds: float = 0.5,
     max_seconds: float = 2.0,
@@ -61,20 +107,7 @@ def humanized_delay(
             # Fallback to provided parameters
             pass
 
-    # Base delay from config
-    base_delay = random.uniform(min_seconds, max_seconds)
-
-    # Add jitter (0-1 seconds additional randomness)
-    jitter = random.uniform(0, 1.0)
-
-    # Micro-variations to make it more human-like
-    micro_variation = random.uniform(-0.1, 0.1)
-
-    # Final delay with all variations
-    final_delay = base_delay + jitter + micro_variation
-
-    # Ensure minimum delay of 0.1s
-    final_delay = max(0.1, final_delay)
+    final_delay = _humanized_delay_seconds(min_seconds, max_seconds)
 
     logger.debug(f"Delaying {action} for {final_delay:.2f}s")
 
@@ -82,40 +115,45 @@ def humanized_delay(
 
 
 def advanced_humanized_delay(
-    action: str = "action", config_manager=None, delay_type: str = "base"
+    action: str = "action",
+    config_manager=None,
+    delay_type: str = "base",
+    cancel_event: Optional[threading.Event] = None,
 ) -> None:
-    """Advanced humanized delay using only config manager"""
+    """Advanced humanized delay using only config manager, cut short by cancel_event"""
     if not config_manager:
         # Fallback to basic delay
         humanized_delay(0.5, 2.0, action)
         return
 
     min_seconds, max_seconds = config_manager.get_humanization_delay(delay_type)
+    final_delay = _advanced_delay_seconds(min_seconds, max_seconds)
 
-    # Advanced human-like patterns
-    base_delay = random.uniform(min_seconds, max_seconds)
-
-    # Add multiple layers of randomness
-    jitter_1 = random.uniform(0, 0.8)  # Primary jitter
-    jitter_2 = random.uniform(0, 0.3)  # Secondary jitter
+    logger.debug(f"Delaying {action} (advanced) for {final_delay:.2f}s")
 
-    # Occasional longer pauses (10% chance)
-    if random.random() < 0.1:
-        pause_bonus = random.uniform(0.5, 1.5)
-        logger.debug(f"Adding thinking pause: {pause_bonus:.2f}s")
+    if cancel_event is not None:
+        cancel_event.wait(final_delay)
     else:
-        pause_bonus = 0
+        sleep(final_delay)
 
-    # Micro-hesitations
-    micro_hesitation = random.uniform(-0.05, 0.15)
 
-    # Final calculation
-    final_delay = base_delay + jitter_1 + jitter_2 + pause_bonus + micro_hesitation
-    final_delay = max(0.1, final_delay)
+# Basic delay ranges per stage when no config manager is available
+_FALLBACK_STAGE_RANGES = {"moving": (0.5, 1.5), "base": (0.3, 0.8)}
 
-    logger.debug(f"Delaying {action} (advanced) for {final_delay:.2f}s")
 
-    sleep(final_delay)
+def humanized_total(config_manager=None, stages=("moving", "base")) -> float:
+    """Sum the advanced delays of several stages so they can be slept at once"""
+    if not config_manager:
+        # Fallback to the basic delay per stage
+        return sum(
+            _humanized_delay_seconds(*_FALLBACK_STAGE_RANGES.get(stage, (0.5, 2.0)))
+            for stage in stages
+        )
+
+    return sum(
+        _advanced_delay_seconds(*config_manager.get_humanization_delay(stage))
+        for stage in stages
+    )
 
 
 def clear_screen() -> None: